@@ -9,129 +9,40 @@ import requests  # For HTTP requests
 import pandas as pd  # For data processing
 import numpy as np  # For numerical operations and missing value handling
 import datetime  # For working with date fields
+from spacex_schema import write_dataset  # Compact dtypes for saved datasets
+from spacex_api import stream_launches, enrich_launches, LAUNCH_FIELDS  # Streaming ingestion and lookups
 
 # Set pandas display options to avoid truncation in output
 pd.set_option('display.max_columns', None)
 pd.set_option('display.max_colwidth', None)
 
-# Step 1: Request SpaceX data from static JSON URL
+# Step 1: Stream SpaceX launch data from static JSON URL
+# Each launch is parsed on its own and reduced to the columns of interest
+# (rocket, payloads, launchpad, cores, flight_number, date_utc) before the next one is read.
+# Launches with multiple payloads or cores, or dated after 2020-11-13, are dropped on the fly,
+# and the single payload/core element is extracted from its list.
 static_json_url = 'https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/API_call_spacex_api.json'
-response = requests.get(static_json_url)
-
-# Check if request was successful (status code 200)
-if response.status_code == 200:
-    data = response.json()
-else:
-    print("Request failed. Status code:", response.status_code)
+try:
+    launches = list(stream_launches(static_json_url, cutoff=datetime.date(2020, 11, 13)))
+except requests.HTTPError as error:
+    print("Request failed. Status code:", error.response.status_code)
     exit()
 
-# Normalize JSON data into pandas DataFrame
-df = pd.json_normalize(data)
-print(df.head())
-
-# Keep only selected columns of interest
-data = df[['rocket', 'payloads', 'launchpad', 'cores', 'flight_number', 'date_utc']]
-
-# Remove records with multiple payloads or cores
-data = data[data['cores'].map(len) == 1]
-data = data[data['payloads'].map(len) == 1]
-
-# Extract the single element from payloads and cores list columns
-data['cores'] = data['cores'].map(lambda x: x[0])
-data['payloads'] = data['payloads'].map(lambda x: x[0])
-
-# Convert date_utc to datetime and extract date only
-data['date'] = pd.to_datetime(data['date_utc']).dt.date
-
-# Filter records with date before or equal to 2020-11-13
-data = data[data['date'] <= datetime.date(2020, 11, 13)]
-
-# Initialize global lists to store extracted values
-BoosterVersion = []
-Longitude = []
-Latitude = []
-LaunchSite = []
-PayloadMass = []
-Orbit = []
-Block = []
-ReusedCount = []
-Serial = []
-Outcome = []
-Flights = []
-GridFins = []
-Reused = []
-Legs = []
-LandingPad = []
-
-# Fetch rocket name by rocket ID
-def getBoosterVersion(data):
-    for rocket_id in data['rocket']:
-        if rocket_id:
-            response = requests.get("https://api.spacexdata.com/v4/rockets/" + str(rocket_id)).json()
-            BoosterVersion.append(response['name'])
-
-# Fetch launchpad details (name, lat, lon) by ID
-def getLaunchSite(data):
-    for pad_id in data['launchpad']:
-        if pad_id:
-            response = requests.get("https://api.spacexdata.com/v4/launchpads/" + str(pad_id)).json()
-            Longitude.append(response['longitude'])
-            Latitude.append(response['latitude'])
-            LaunchSite.append(response['name'])
-
-# Fetch payload mass and orbit by payload ID
-def getPayloadData(data):
-    for payload_id in data['payloads']:
-        if payload_id:
-            response = requests.get("https://api.spacexdata.com/v4/payloads/" + str(payload_id)).json()
-            PayloadMass.append(response.get('mass_kg'))
-            Orbit.append(response.get('orbit'))
-
-# Fetch core-related information
-def getCoreData(data):
-    for core in data['cores']:
-        if core.get('core') is not None:
-            response = requests.get("https://api.spacexdata.com/v4/cores/" + str(core['core'])).json()
-            Block.append(response.get('block'))
-            ReusedCount.append(response.get('reuse_count'))
-            Serial.append(response.get('serial'))
-        else:
-            Block.append(None)
-            ReusedCount.append(None)
-            Serial.append(None)
-        Outcome.append(str(core.get('landing_success')) + ' ' + str(core.get('landing_type')))
-        Flights.append(core.get('flight'))
-        GridFins.append(core.get('gridfins'))
-        Reused.append(core.get('reused'))
-        Legs.append(core.get('legs'))
-        LandingPad.append(core.get('landpad'))
+# Build DataFrame from the surviving launches only
+data = pd.DataFrame(launches, columns=LAUNCH_FIELDS + ['date'])
+print(data.head())
 
-# Execute API fetch functions
-getBoosterVersion(data)
-getLaunchSite(data)
-getPayloadData(data)
-getCoreData(data)
+# Execute API fetch functions (rockets, launchpads, payloads, cores)
+columns = enrich_launches(data)
 
 # Construct final DataFrame with all extracted information
 launch_dict = {
     'FlightNumber': list(data['flight_number']),
     'Date': list(data['date']),
-    'BoosterVersion': BoosterVersion,
-    'PayloadMass': PayloadMass,
-    'Orbit': Orbit,
-    'LaunchSite': LaunchSite,
-    'Outcome': Outcome,
-    'Flights': Flights,
-    'GridFins': GridFins,
-    'Reused': Reused,
-    'Legs': Legs,
-    'LandingPad': LandingPad,
-    'Block': Block,
-    'ReusedCount': ReusedCount,
-    'Serial': Serial,
-    'Longitude': Longitude,
-    'Latitude': Latitude
 }
+for name in ['BoosterVersion', 'PayloadMass', 'Orbit', 'LaunchSite', 'Outcome', 'Flights', 'GridFins',
+             'Reused', 'Legs', 'LandingPad', 'Block', 'ReusedCount', 'Serial', 'Longitude', 'Latitude']:
+    launch_dict[name] = columns[name]
 
 launch_df = pd.DataFrame(launch_dict)
 print(launch_df.head())
@@ -154,6 +65,6 @@ data_falcon9['PayloadMass'].fillna(payload_mean, inplace=True)
 print(data_falcon9.isnull().sum())
 
 # Save final cleaned dataset to CSV
-data_falcon9.to_csv('dataset_part_1.csv', index=False)
+write_dataset(data_falcon9, 'dataset_part_1.csv')
 print("Cleaned data saved to dataset_part_1.csv")
 
@@ -7,46 +7,9 @@
 
 import requests
 from bs4 import BeautifulSoup
-import re
-import unicodedata
 import pandas as pd
-
-# Helper function: extract date and time from table cell
-def date_time(table_cells):
-    return [data_time.strip() for data_time in list(table_cells.strings)][0:2]
-
-# Helper function: extract booster version string
-def booster_version(table_cells):
-    out = ''.join([booster_version for i, booster_version in enumerate(table_cells.strings) if i % 2 == 0][0:-1])
-    return out
-
-# Helper function: extract landing status from cell
-def landing_status(table_cells):
-    out = [i for i in table_cells.strings][0]
-    return out
-
-# Helper function: clean payload mass value (extract in kg)
-def get_mass(table_cells):
-    mass = unicodedata.normalize("NFKD", table_cells.text).strip()
-    if mass:
-        mass.find("kg")
-        new_mass = mass[0:mass.find("kg") + 2]
-    else:
-        new_mass = 0
-    return new_mass
-
-# Helper function: extract and clean column name from header
-def extract_column_from_header(row):
-    if row.br:
-        row.br.extract()
-    if row.a:
-        row.a.extract()
-    if row.sup:
-        row.sup.extract()
-    colunm_name = ' '.join(row.contents)
-    if not (colunm_name.strip().isdigit()):
-        colunm_name = colunm_name.strip()
-        return colunm_name
+from spacex_schema import write_dataset
+from spacex_scrape import extract_column_from_header, parse_launch_rows, LAUNCH_COLUMNS
 
 # Request HTML from static Wikipedia snapshot
 static_url = "https://en.wikipedia.org/w/index.php?title=List_of_Falcon_9_and_Falcon_Heavy_launches&oldid=1027686922"
@@ -84,66 +47,15 @@ if 'Date and time ( )' in launch_dict:
     del launch_dict['Date and time ( )']
 
 # Initialize all fields as empty lists
-launch_dict['Flight No.'] = []
-launch_dict['Launch site'] = []
-launch_dict['Payload'] = []
-launch_dict['Payload mass'] = []
-launch_dict['Orbit'] = []
-launch_dict['Customer'] = []
-launch_dict['Launch outcome'] = []
-launch_dict['Version Booster'] = []
-launch_dict['Booster landing'] = []
-launch_dict['Date'] = []
-launch_dict['Time'] = []
+for column in LAUNCH_COLUMNS:
+    launch_dict[column] = []
 
 # Loop through all target tables and extract row data
-extracted_row = 0
-for table_number, table in enumerate(soup.find_all('table', "wikitable plainrowheaders collapsible")):
-    for rows in table.find_all("tr"):
-        if rows.th:
-            if rows.th.string:
-                flight_number = rows.th.string.strip()
-                flag = flight_number.isdigit()
-        else:
-            flag = False
-
-        row = rows.find_all('td')
-        if flag:
-            extracted_row += 1
-
-            launch_dict['Flight No.'].append(flight_number)
-
-            datatimelist = date_time(row[0])
-            date = datatimelist[0].strip(',')
-            time = datatimelist[1]
-            launch_dict['Date'].append(date)
-            launch_dict['Time'].append(time)
-
-            bv = booster_version(row[1])
-            if not bv:
-                bv = row[1].a.string
-            launch_dict['Version Booster'].append(bv)
-
-            launch_site = row[2].a.string
-            launch_dict['Launch site'].append(launch_site)
-
-            payload = row[3].a.string
-            launch_dict['Payload'].append(payload)
-
-            payload_mass = get_mass(row[4])
-            launch_dict['Payload mass'].append(payload_mass)
-
-            orbit = row[5].a.string
-            launch_dict['Orbit'].append(orbit)
-
-            customer = row[6].a.string
-            launch_dict['Customer'].append(customer)
-
-            launch_outcome = list(row[7].strings)[0]
-            launch_dict['Launch outcome'].append(launch_outcome)
-
-            booster_landing = landing_status(row[8])
-            launch_dict['Booster landing'].append(booster_landing)
+launches = parse_launch_rows(soup)
+extracted_row = len(launches)
+for launch in launches:
+    for column in LAUNCH_COLUMNS:
+        launch_dict[column].append(launch[column])
 
 # Convert dictionary to pandas DataFrame
 df = pd.DataFrame({key: pd.Series(value) for key, value in launch_dict.items()})
@@ -153,5 +65,5 @@ print("Preview of constructed DataFrame:")
 print(df.head())
 
 # Save DataFrame to CSV
-df.to_csv('spacex_web_scraped.csv', index=False)
+df = write_dataset(df, 'spacex_web_scraped.csv')
 print("Data saved to spacex_web_scraped.csv")
@@ -5,11 +5,11 @@
 # Author: Harry.Zhang
 # ----------------------------------------------------------
 
-import pandas as pd  # For data processing
 import numpy as np   # For numerical operations
+from spacex_schema import read_dataset, write_dataset  # Compact dtypes per dataset
 
 # Load the dataset saved from previous step
-df = pd.read_csv("dataset_part_1.csv")
+df = read_dataset("dataset_part_1.csv")
 
 # Preview the first few rows
 print(df.head(10))
@@ -56,13 +56,7 @@ print(bad_outcomes)
 # ----------------------------------------------------------
 # TASK 4: Create 'Class' column (1 = success, 0 = failure)
 # ----------------------------------------------------------
-landing_class = []
-for outcome in df['Outcome']:
-    if outcome in bad_outcomes:
-        landing_class.append(0)
-    else:
-        landing_class.append(1)
-df['Class'] = landing_class
+df['Class'] = (~df['Outcome'].isin(bad_outcomes)).astype('int8')
 
 # Preview classification results
 print("Landing outcome and class labels:")
@@ -73,5 +67,5 @@ success_rate = df['Class'].mean()
 print("Overall success rate:", success_rate)
 
 # Save the modified dataset to CSV
-df.to_csv("dataset_part_2.csv", index=False)
+df = write_dataset(df, "dataset_part_2.csv")
 print("Cleaned data with landing class saved to dataset_part_2.csv")
@@ -1,26 +1,30 @@
 # ----------------------------------------------------------
 # SpaceX Rocket Launch Data Project Script 4
-# Purpose: Build SQLite database, load CSV data, run SQL queries (Jupyter & native)
+# Purpose: Build SQLite database, load CSV data, run SQL queries (Jupyter & native), add dashboard table
 # Key Concepts: sqlite3 operations, pandas-SQL integration, query demonstrations
 # Author: Harry.Zhang
 # ----------------------------------------------------------
 
 import sqlite3
-import pandas as pd
 import os
+from spacex_schema import read_dataset
+from spacex_dash_data import write_dash_table
 
 # Load CSV data
 csv_url = "https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/labs/module_2/data/Spacex.csv"
-df = pd.read_csv(csv_url)
+df = read_dataset(csv_url)
 print("Preview of CSV data:")
 print(df.head())
 
 # Create SQLite database
+# Built in a temporary file and moved into place at the end, so dashboard workers reading
+# the old database never see a half-written one and reopen when the file changes
 db_file = "my_data1.db"
-if os.path.exists(db_file):
-    os.remove(db_file)
+build_file = db_file + ".tmp"
+if os.path.exists(build_file):
+    os.remove(build_file)
 
-conn = sqlite3.connect(db_file)
+conn = sqlite3.connect(build_file)
 cur = conn.cursor()
 
 # Write to table
@@ -74,6 +78,21 @@ for desc, q in queries:
         print(row)
     print()
 
+# -----------------------------------------------
+# Dashboard table (read by IBM 7 when SPACEX_DASH_DB points at this file)
+# -----------------------------------------------
+
+dash_url = "https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/spacex_launch_dash.csv"
+write_dash_table(read_dataset(dash_url), conn)
+print("Dashboard table 'SPACEX_DASH' created with site/payload indexes")
+
 # Close connection
 conn.close()
 print("\nDatabase connection closed.")
+
+# Swap the new database in; WAL/shared-memory files left by an earlier WAL build belong to the old file
+os.replace(build_file, db_file)
+for suffix in ("-wal", "-shm"):
+    if os.path.exists(db_file + suffix):
+        os.remove(db_file + suffix)
+print(f"Database written to {db_file}")
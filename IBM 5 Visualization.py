@@ -9,12 +9,13 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from spacex_schema import read_dataset, write_dataset
 
 # Set seaborn style
 sns.set(style="whitegrid")
 
 # Load dataset
-df = pd.read_csv("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/dataset_part_2.csv")
+df = read_dataset("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/dataset_part_2.csv")
 
 # Task 1: Flight Number vs Launch Site
 plt.figure(figsize=(12, 6))
@@ -37,7 +38,7 @@ plt.savefig("task2_payload_vs_launchsite.png")
 plt.close()
 
 # Task 3: Success rate by Orbit
-orbit_success = df.groupby("Orbit")["Class"].mean().reset_index()
+orbit_success = df.groupby("Orbit", observed=True)["Class"].mean().reset_index()
 plt.figure(figsize=(10, 6))
 sns.barplot(x="Orbit", y="Class", data=orbit_success)
 plt.xlabel("Orbit Type", fontsize=14)
@@ -69,7 +70,7 @@ plt.savefig("task5_payload_vs_orbit.png")
 plt.close()
 
 # Task 6: Yearly success trend
-df['Year'] = df['Date'].apply(lambda x: int(x.split("-")[0]))
+df['Year'] = df['Date'].dt.year
 yearly_success = df.groupby("Year")["Class"].mean().reset_index()
 plt.figure(figsize=(10, 6))
 plt.plot(yearly_success["Year"], yearly_success["Class"], marker='o')
@@ -86,8 +87,7 @@ features = df[['FlightNumber', 'PayloadMass', 'Orbit', 'LaunchSite', 'LandingPad
                'GridFins', 'Reused', 'Legs', 'Block', 'ReusedCount', 'Serial']]
 features_one_hot = pd.get_dummies(features, columns=['Orbit', 'LaunchSite', 'LandingPad', 'Serial'])
 
-# Task 8: Convert to float64 and save as CSV
-features_one_hot = features_one_hot.astype('float64')
-features_one_hot.to_csv("dataset_part_3.csv", index=False)
+# Task 8: Convert to float and save as CSV (float32 per the dataset_part_3 schema)
+features_one_hot = write_dataset(features_one_hot, "dataset_part_3.csv")
 print("dataset_part_3.csv successfully saved")
 print("All charts saved as .png files in current directory")
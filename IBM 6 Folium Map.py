@@ -5,17 +5,17 @@
 # Author: Harry.Zhang
 # ----------------------------------------------------------
 
-import pandas as pd
 import folium
 from folium.plugins import MarkerCluster, MousePosition
 from folium.features import DivIcon
-from math import sin, cos, sqrt, atan2, radians
+from spacex_schema import read_dataset
+from spacex_maps import calculate_distance
 
 # Load launch data (CSV must be downloaded and placed locally)
-spacex_df = pd.read_csv("spacex_launch_geo.csv")
+spacex_df = read_dataset("spacex_launch_geo.csv")
 
 # Compute center coordinates for each launch site
-launch_sites_df = spacex_df.groupby('Launch Site', as_index=False).first()
+launch_sites_df = spacex_df.groupby('Launch Site', as_index=False, observed=True).first()
 launch_sites_df = launch_sites_df[['Launch Site', 'Lat', 'Long']]
 
 # Initialize base map centered on NASA JSC
@@ -49,16 +49,6 @@ mouse_position = MousePosition(
     prefix='Lat:', lat_formatter=formatter, lng_formatter=formatter)
 site_map.add_child(mouse_position)
 
-# Distance calculation function (Haversine formula)
-def calculate_distance(lat1, lon1, lat2, lon2):
-    R = 6373.0
-    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
-    dlon = lon2 - lon1
-    dlat = lat2 - lat1
-    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    return R * c
-
 # Example: draw distance from LC-40 to coastline
 launch_site_lat, launch_site_lon = 28.562302, -80.577356
 coastline_lat, coastline_lon = 28.56367, -80.57163
@@ -80,3 +70,4 @@ site_map.add_child(lines)
 # Export map to HTML
 site_map.save('spacex_launch_map.html')
 print("Map saved as spacex_launch_map.html. Open it in a browser to view.")
+print("For per-site maps with a lazy-loading index, run: python spacex.py map-sites")
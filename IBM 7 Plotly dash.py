@@ -5,22 +5,36 @@
 # Author: Harry.Zhang
 # ----------------------------------------------------------
 
-import pandas as pd
+import os
+import importlib.util
 import dash
 from dash import dcc, html
 from dash.dependencies import Input, Output
 import plotly.express as px
-
-# Load dataset
-df = pd.read_csv("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/spacex_launch_dash.csv")
+from spacex_schema import read_dataset
+from spacex_dash_data import FrameStore, SqliteStore
+from spacex_figures import compact_scatter, viewport_from_relayout
+
+# Load dataset: from the SQLite database built by IBM 4 when SPACEX_DASH_DB is set,
+# otherwise the whole CSV is kept in memory
+dash_db = os.environ.get('SPACEX_DASH_DB')
+if dash_db:
+    store = SqliteStore(dash_db, pool_size=int(os.environ.get('SPACEX_DASH_POOL', 4)))
+else:
+    store = FrameStore(read_dataset("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/spacex_launch_dash.csv"))
 
 # Extract payload range boundaries
-min_payload = df['Payload Mass (kg)'].min()
-max_payload = df['Payload Mass (kg)'].max()
+min_payload, max_payload = store.payload_bounds()
+
+# Compact figure delivery (SPACEX_DASH_FIGURES=compact): WebGL above a point threshold,
+# typed arrays, viewport decimation and gzip responses when flask-compress is installed
+compact_figures = os.environ.get('SPACEX_DASH_FIGURES') == 'compact'
+compress = compact_figures and importlib.util.find_spec('flask_compress') is not None
 
 # Initialize Dash app
-app = dash.Dash(__name__)
+app = dash.Dash(__name__, compress=compress)
 app.title = "SpaceX Launch Dashboard"
+server = app.server  # WSGI entry point for running several gunicorn workers
 
 # Layout definition
 app.layout = html.Div(children=[
@@ -31,7 +45,7 @@ app.layout = html.Div(children=[
     dcc.Dropdown(
         id='site-dropdown',
         options=[{'label': 'All Sites', 'value': 'ALL'}] +
-                [{'label': site, 'value': site} for site in df['Launch Site'].unique()],
+                [{'label': site, 'value': site} for site in store.launch_sites()],
         value='ALL',
         placeholder='Select a Launch Site',
         searchable=True
@@ -66,29 +80,36 @@ app.layout = html.Div(children=[
 )
 def update_pie_chart(selected_site):
     if selected_site == 'ALL':
-        fig = px.pie(df, values='class', names='Launch Site',
+        fig = px.pie(store.success_by_site(), values='class', names='Launch Site',
                      title='Total Success Launches By Site')
     else:
-        filtered_df = df[df['Launch Site'] == selected_site]
-        site_counts = filtered_df['class'].value_counts().reset_index()
-        site_counts.columns = ['class', 'count']
+        site_counts = store.site_outcomes(selected_site)
         site_counts['class'] = site_counts['class'].replace({1: 'Success', 0: 'Failure'})
         fig = px.pie(site_counts, values='count', names='class',
                      title=f'Total Launch Outcomes for site {selected_site}')
     return fig
 
-# Callback for scatter plot
+# Callback for scatter plot (compact mode also redraws on zoom/pan to decimate off-screen points)
+scatter_inputs = [Input('site-dropdown', 'value'),
+                  Input('payload-slider', 'value')]
+if compact_figures:
+    scatter_inputs.append(Input('success-payload-scatter-chart', 'relayoutData'))
+
 @app.callback(
     Output('success-payload-scatter-chart', 'figure'),
-    [Input('site-dropdown', 'value'),
-     Input('payload-slider', 'value')]
+    scatter_inputs
 )
-def update_scatter_plot(selected_site, payload_range):
-    filtered_df = df[(df['Payload Mass (kg)'] >= payload_range[0]) &
-                     (df['Payload Mass (kg)'] <= payload_range[1])]
-
-    if selected_site != 'ALL':
-        filtered_df = filtered_df[filtered_df['Launch Site'] == selected_site]
+def update_scatter_plot(selected_site, payload_range, relayout_data=None):
+    filtered_df = store.payload_rows(selected_site, payload_range[0], payload_range[1])
+
+    if compact_figures:
+        # relayoutData keeps the last zoom; it only describes this chart when the zoom fired the callback
+        triggered = [item['prop_id'] for item in dash.callback_context.triggered]
+        zoomed = 'success-payload-scatter-chart.relayoutData' in triggered
+        return compact_scatter(filtered_df, 'Payload Mass (kg)', 'class', 'Booster Version Category',
+                               'Correlation between Payload and Success',
+                               viewport=viewport_from_relayout(relayout_data) if zoomed else None,
+                               uirevision='%s %s' % (selected_site, payload_range))
 
     fig = px.scatter(filtered_df, x='Payload Mass (kg)', y='class',
                      color='Booster Version Category',
@@ -5,7 +5,6 @@
 # Author: Harry.Zhang
 # ----------------------------------------------------------
 
-import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -16,6 +15,7 @@ from sklearn.svm import SVC
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.metrics import confusion_matrix
+from spacex_schema import read_dataset
 
 # Plot confusion matrix helper
 def plot_confusion_matrix(y, y_predict, title):
@@ -30,8 +30,8 @@ def plot_confusion_matrix(y, y_predict, title):
     plt.show()
 
 # Task 1: Load data
-X = pd.read_csv("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/dataset_part_3.csv")
-data = pd.read_csv("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/dataset_part_2.csv")
+X = read_dataset("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/dataset_part_3.csv")
+data = read_dataset("https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/IBM-DS0321EN-SkillsNetwork/datasets/dataset_part_2.csv")
 
 # Task 2: Extract target variable Y
 Y = data['Class'].to_numpy()
@@ -0,0 +1,131 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Command line entry point
+# Purpose: Run any single project step (spacex fetch|scrape|wrangle|sql|plots|map|map-sites|dashboard|train|refresh)
+# Key Concepts: argparse sub-commands, lazy per-command imports via runpy, import-time benchmark
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+# Only the standard library is imported here; each stage script imports its own
+# stack (pandas, seaborn, sklearn, folium, dash ...) when its command runs.
+import argparse
+import ast
+import json
+import os
+import runpy
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# command: (stage script, description, heavy packages the stage is allowed to import)
+STAGES = {
+    'fetch': ("IBM 1 Api_data.py.py", "Retrieve launches from the SpaceX API -> dataset_part_1.csv",
+              ('pandas', 'numpy', 'requests')),
+    'scrape': ("IBM 2 Web_scraping.py", "Scrape the Falcon 9 launch table -> spacex_web_scraped.csv",
+               ('pandas', 'numpy', 'requests', 'bs4')),
+    'wrangle': ("IBM 3 Data wrangling.py", "Add landing class labels -> dataset_part_2.csv",
+                ('pandas', 'numpy')),
+    'sql': ("IBM 4 Sql database.py", "Load Spacex.csv into SQLite and run the example queries",
+            ('pandas', 'numpy')),
+    'plots': ("IBM 5 Visualization.py", "EDA charts and one-hot features -> dataset_part_3.csv",
+              ('pandas', 'numpy', 'matplotlib', 'seaborn')),
+    'map': ("IBM 6 Folium Map.py", "Launch site map -> spacex_launch_map.html",
+            ('pandas', 'numpy', 'folium', 'requests')),
+    'map-sites': ("spacex_maps.py", "Per-site launch maps built in parallel + lazy-loading index page",
+                  ('pandas', 'numpy', 'folium', 'requests')),
+    'dashboard': ("IBM 7 Plotly dash.py", "Serve the Plotly Dash launch dashboard",
+                  ('pandas', 'numpy', 'dash', 'plotly')),
+    'train': ("IBM 8 Machine learning.py", "Train and compare the landing classifiers",
+              ('pandas', 'numpy', 'matplotlib', 'seaborn', 'sklearn')),
+    'refresh': ("spacex_incremental.py", "Update the saved classifiers from newly appended launches",
+                ('pandas', 'numpy', 'sklearn')),
+}
+
+# Packages whose import cost the benchmark tracks
+HEAVY_PACKAGES = ('pandas', 'numpy', 'requests', 'bs4', 'matplotlib', 'seaborn', 'sklearn', 'folium',
+                  'dash', 'plotly')
+
+
+# Execute a stage script as __main__ (so IBM 7 starts its server). The project directory is put on
+# sys.path for the shared modules; CSV inputs and outputs stay relative to the current directory,
+# as when the script is run directly. Any extra command line arguments are handed to the script.
+def run_stage(command, extra_args=()):
+    script = os.path.join(HERE, STAGES[command][0])
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    sys.argv = [script] + list(extra_args)
+    runpy.run_path(script, run_name='__main__')
+
+
+# Run only the top-level import statements of a stage and report time and heavy packages loaded
+def probe_imports(command):
+    script = os.path.join(HERE, STAGES[command][0])
+    with open(script, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), script)
+    imports = ast.Module(body=[node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))],
+                         type_ignores=[])
+    sys.path.insert(0, HERE)
+
+    start = time.perf_counter()
+    error = None
+    try:
+        exec(compile(imports, script, 'exec'), {'__name__': '__probe__'})
+    except ImportError as exc:
+        error = str(exc)
+    elapsed = time.perf_counter() - start
+
+    loaded = sorted(package for package in HEAVY_PACKAGES if package in sys.modules)
+    return {'command': command, 'seconds': elapsed, 'loaded': loaded, 'error': error}
+
+
+# Probe every command in a fresh interpreter; fails if a command loads packages it does not declare
+# or if its imports could not all be checked
+def benchmark_imports(commands):
+    failed = False
+    print("%-10s %8s  %s" % ("command", "import s", "heavy packages loaded"))
+    for command in commands:
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), 'imports', '--probe', command],
+                                capture_output=True, text=True, check=True).stdout
+        total = time.perf_counter() - start
+        result = json.loads(output)
+        unexpected = sorted(set(result['loaded']) - set(STAGES[command][2]))
+        failed = failed or bool(unexpected) or bool(result['error'])
+
+        note = ''
+        if unexpected:
+            note = '  UNEXPECTED: ' + ', '.join(unexpected)
+        if result['error']:
+            note += '  INCOMPLETE: %s' % result['error']
+        print("%-10s %8.3f  %s%s  [process %.2fs]"
+              % (command, result['seconds'], ', '.join(result['loaded']) or '-', note, total))
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='spacex', description="SpaceX launch data project steps")
+    commands = parser.add_subparsers(dest='command', required=True)
+    for command, (script, description, _) in STAGES.items():
+        commands.add_parser(command, help=description, description="%s (%s)" % (description, script))
+    imports_parser = commands.add_parser('imports', help="Benchmark the import cost of each command")
+    imports_parser.add_argument('names', nargs='*', metavar='command', help="commands to measure (default: all)")
+    imports_parser.add_argument('--probe', choices=list(STAGES), help=argparse.SUPPRESS)
+    args, extra_args = parser.parse_known_args(argv)
+
+    if args.command != 'imports':
+        run_stage(args.command, extra_args)
+        return 0
+    if extra_args:
+        parser.error("unrecognized arguments: %s" % ' '.join(extra_args))
+    if args.probe:
+        print(json.dumps(probe_imports(args.probe)))
+        return 0
+    unknown = [name for name in args.names if name not in STAGES]
+    if unknown:
+        parser.error("unknown command(s): %s" % ', '.join(unknown))
+    return benchmark_imports(args.names or list(STAGES))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
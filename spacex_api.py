@@ -0,0 +1,213 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - SpaceX API enrichment
+# Purpose: Stream the launch list and look up rocket, launchpad, payload and core details (used by IBM 1 and the load test)
+# Key Concepts: streaming JSON parsing, early projection, REST lookups, retry with backoff on 429/5xx
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import codecs
+import datetime
+import json
+import time
+import requests
+
+SPACEX_API_URL = "https://api.spacexdata.com/v4"
+
+# Status codes that are retried: rate limiting and transient server errors
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Whitespace allowed between JSON tokens
+JSON_WHITESPACE = ' \t\r\n'
+
+# Launch fields kept by IBM 1; everything else in the API document is dropped while parsing
+LAUNCH_FIELDS = ['rocket', 'payloads', 'launchpad', 'cores', 'flight_number', 'date_utc']
+
+
+# Empty statistics record filled in by get_json
+def new_stats():
+    return {'requests': 0, 'retries': 0, 'rate_limited': 0, 'errors': 0, 'latencies': []}
+
+
+# Yield the elements of a top-level JSON array from an iterable of text chunks, one at a time.
+# Only the not-yet-parsed tail of the stream is kept in memory. The array must be well formed:
+# exactly one comma between elements, no trailing comma and nothing but whitespace after "]".
+def iter_json_array(chunks):
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    # 'open': before "[", 'first': first element or "]", 'value': element after a comma,
+    # 'next': "," or "]" after an element, 'done': after the closing bracket
+    state = 'open'
+    exhausted = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in JSON_WHITESPACE:
+            pos += 1
+        if pos < len(buffer):
+            char = buffer[pos]
+            if state == 'done':
+                raise ValueError("Unexpected data after the JSON array: %r" % buffer[pos:pos + 20])
+            if state == 'open':
+                if char != '[':
+                    raise ValueError("Expected a JSON array")
+                state = 'first'
+                pos += 1
+                continue
+            if state == 'next':
+                if char not in ',]':
+                    raise ValueError("Expected ',' or ']' between array elements, got %r" % char)
+                state = 'value' if char == ',' else 'done'
+                pos += 1
+                continue
+            if char == ']' and state == 'first':
+                state = 'done'
+                pos += 1
+                continue
+            if char in ',]':
+                raise ValueError("Expected an array element, got %r" % char)
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+            else:
+                # A number is only complete once a delimiter follows it ("2." may become "2.5")
+                complete = end < len(buffer) and buffer[end] in JSON_WHITESPACE + ',]'
+                if complete or exhausted or not isinstance(item, (int, float)):
+                    yield item
+                    state = 'next'
+                    pos = end
+                    continue
+        if exhausted:
+            if state == 'done':
+                return
+            if state == 'open':
+                raise ValueError("Expected a JSON array")
+            raise ValueError("JSON array ended before its closing bracket")
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+        else:
+            buffer = buffer[pos:] + (chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk)
+            pos = 0
+
+
+# Project one API launch record to LAUNCH_FIELDS and apply the IBM 1 filters.
+# Returns None for launches with several cores/payloads or after the cutoff date.
+def select_launch(record, cutoff=None):
+    if len(record['cores']) != 1 or len(record['payloads']) != 1:
+        return None
+    date = datetime.date.fromisoformat(record['date_utc'][:10])
+    if cutoff is not None and date > cutoff:
+        return None
+    launch = {field: record[field] for field in LAUNCH_FIELDS}
+    launch['cores'] = launch['cores'][0]
+    launch['payloads'] = launch['payloads'][0]
+    launch['date'] = date
+    return launch
+
+
+# Stream the launches document from url, keeping only the selected launches
+def stream_launches(url, cutoff=None, session=None, chunk_size=64 * 1024, timeout=60):
+    http = session or requests
+    with http.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')()
+        chunks = (decoder.decode(chunk) for chunk in response.iter_content(chunk_size))
+        for record in iter_json_array(chunks):
+            launch = select_launch(record, cutoff)
+            if launch is not None:
+                yield launch
+
+
+# GET <base_url>/<resource>/<item_id> as JSON, retrying 429/5xx with exponential backoff
+def get_json(resource, item_id, base_url=SPACEX_API_URL, session=None, stats=None,
+             retries=5, backoff=0.5, timeout=30):
+    url = "%s/%s/%s" % (base_url, resource, item_id)
+    http = session or requests
+    for attempt in range(retries + 1):
+        start = time.perf_counter()
+        response = http.get(url, timeout=timeout)
+        if stats is not None:
+            stats['requests'] += 1
+            stats['latencies'].append(time.perf_counter() - start)
+
+        if response.status_code not in RETRY_STATUS or attempt == retries:
+            break
+
+        if stats is not None:
+            stats['retries'] += 1
+            if response.status_code == 429:
+                stats['rate_limited'] += 1
+            else:
+                stats['errors'] += 1
+        delay = response.headers.get('Retry-After', '')
+        time.sleep(float(delay) if delay.replace('.', '', 1).isdigit() else backoff * 2 ** attempt)
+
+    response.raise_for_status()
+    return response.json()
+
+
+# Fetch rocket name by rocket ID
+def getBoosterVersion(data, base_url=SPACEX_API_URL, session=None, stats=None):
+    BoosterVersion = []
+    for rocket_id in data['rocket']:
+        if rocket_id:
+            response = get_json('rockets', rocket_id, base_url, session, stats)
+            BoosterVersion.append(response['name'])
+    return {'BoosterVersion': BoosterVersion}
+
+# Fetch launchpad details (name, lat, lon) by ID
+def getLaunchSite(data, base_url=SPACEX_API_URL, session=None, stats=None):
+    Longitude, Latitude, LaunchSite = [], [], []
+    for pad_id in data['launchpad']:
+        if pad_id:
+            response = get_json('launchpads', pad_id, base_url, session, stats)
+            Longitude.append(response['longitude'])
+            Latitude.append(response['latitude'])
+            LaunchSite.append(response['name'])
+    return {'Longitude': Longitude, 'Latitude': Latitude, 'LaunchSite': LaunchSite}
+
+# Fetch payload mass and orbit by payload ID
+def getPayloadData(data, base_url=SPACEX_API_URL, session=None, stats=None):
+    PayloadMass, Orbit = [], []
+    for payload_id in data['payloads']:
+        if payload_id:
+            response = get_json('payloads', payload_id, base_url, session, stats)
+            PayloadMass.append(response.get('mass_kg'))
+            Orbit.append(response.get('orbit'))
+    return {'PayloadMass': PayloadMass, 'Orbit': Orbit}
+
+# Fetch core-related information
+def getCoreData(data, base_url=SPACEX_API_URL, session=None, stats=None):
+    columns = {name: [] for name in ['Block', 'ReusedCount', 'Serial', 'Outcome', 'Flights',
+                                     'GridFins', 'Reused', 'Legs', 'LandingPad']}
+    for core in data['cores']:
+        if core.get('core') is not None:
+            response = get_json('cores', core['core'], base_url, session, stats)
+            columns['Block'].append(response.get('block'))
+            columns['ReusedCount'].append(response.get('reuse_count'))
+            columns['Serial'].append(response.get('serial'))
+        else:
+            columns['Block'].append(None)
+            columns['ReusedCount'].append(None)
+            columns['Serial'].append(None)
+        columns['Outcome'].append(str(core.get('landing_success')) + ' ' + str(core.get('landing_type')))
+        columns['Flights'].append(core.get('flight'))
+        columns['GridFins'].append(core.get('gridfins'))
+        columns['Reused'].append(core.get('reused'))
+        columns['Legs'].append(core.get('legs'))
+        columns['LandingPad'].append(core.get('landpad'))
+    return columns
+
+# Run all four lookups and return the extracted columns by name
+def enrich_launches(data, base_url=SPACEX_API_URL, session=None, stats=None):
+    http = session or requests.Session()
+    try:
+        columns = {}
+        for lookup in (getBoosterVersion, getLaunchSite, getPayloadData, getCoreData):
+            columns.update(lookup(data, base_url, http, stats))
+    finally:
+        if session is None:
+            http.close()
+    return columns
@@ -0,0 +1,180 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Local SpaceX API stand-in
+# Purpose: Serve /v4/rockets, /v4/launchpads, /v4/payloads and /v4/cores from fixtures with configurable latency, errors and rate limits
+# Key Concepts: http.server, recorded fixtures, token-bucket rate limiting (429), fault injection
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RESOURCES = ('rockets', 'launchpads', 'payloads', 'cores')
+
+
+# Read <fixture_dir>/<resource>.json (a list of records with 'id') into {resource: {id: record}}
+def load_fixtures(fixture_dir):
+    fixtures = {}
+    for resource in RESOURCES + ('launches',):
+        path = os.path.join(fixture_dir, resource + '.json')
+        if os.path.exists(path):
+            with open(path) as f:
+                records = json.load(f)
+            fixtures[resource] = records if resource == 'launches' else {r['id']: r for r in records}
+    return fixtures
+
+
+# Record every rocket/launchpad/payload/core referenced by the launches from the real API
+def record_fixtures(launches, fixture_dir, base_url=None):
+    from spacex_api import get_json, SPACEX_API_URL
+
+    ids = {resource: set() for resource in RESOURCES}
+    for launch in launches:
+        ids['rockets'].add(launch['rocket'])
+        ids['launchpads'].add(launch['launchpad'])
+        ids['payloads'].update(launch['payloads'])
+        ids['cores'].update(core['core'] for core in launch['cores'] if core.get('core'))
+
+    os.makedirs(fixture_dir, exist_ok=True)
+    for resource, resource_ids in ids.items():
+        records = [get_json(resource, item_id, base_url or SPACEX_API_URL) for item_id in sorted(resource_ids)]
+        with open(os.path.join(fixture_dir, resource + '.json'), 'w') as f:
+            json.dump(records, f)
+    with open(os.path.join(fixture_dir, 'launches.json'), 'w') as f:
+        json.dump(launches, f)
+
+
+# Synthetic launches plus the records they reference, in the v4 API shape
+def generate_fixtures(n_launches=100, seed=0):
+    rng = random.Random(seed)
+    fixtures = {
+        'rockets': {'rocket-f1': {'id': 'rocket-f1', 'name': 'Falcon 1'},
+                    'rocket-f9': {'id': 'rocket-f9', 'name': 'Falcon 9'}},
+        'launchpads': {},
+        'payloads': {},
+        'cores': {},
+        'launches': [],
+    }
+    pads = [('CCSFS SLC 40', 28.5618571, -80.577366), ('KSC LC 39A', 28.6080585, -80.6039558),
+            ('VAFB SLC 4E', 34.632093, -120.610829)]
+    for i, (name, lat, lon) in enumerate(pads):
+        fixtures['launchpads']['pad-%d' % i] = {'id': 'pad-%d' % i, 'name': name, 'latitude': lat, 'longitude': lon}
+
+    for n in range(1, n_launches + 1):
+        core_id = 'core-%d' % rng.randint(1, max(1, n_launches // 3))
+        fixtures['cores'].setdefault(core_id, {'id': core_id, 'block': rng.randint(1, 5),
+                                               'reuse_count': rng.randint(0, 10), 'serial': 'B%d' % (1000 + n)})
+        payload_id = 'payload-%d' % n
+        fixtures['payloads'][payload_id] = {'id': payload_id, 'mass_kg': rng.choice([None, rng.randint(300, 15600)]),
+                                            'orbit': rng.choice(['LEO', 'ISS', 'GTO', 'PO', 'SSO'])}
+        fixtures['launches'].append({
+            'flight_number': n,
+            'date_utc': '%d-%02d-%02dT12:00:00.000Z' % (2006 + n // 12, n % 12 + 1, n % 28 + 1),
+            'rocket': 'rocket-f1' if n <= 5 else 'rocket-f9',
+            'launchpad': 'pad-%d' % rng.randrange(len(pads)),
+            'payloads': [payload_id],
+            'cores': [{'core': core_id, 'flight': rng.randint(1, 5), 'gridfins': n > 5, 'legs': n > 5,
+                       'reused': rng.random() < 0.5, 'landing_success': rng.choice([True, False, None]),
+                       'landing_type': rng.choice(['ASDS', 'RTLS', 'Ocean', None]),
+                       'landpad': rng.choice([None, 'lz-1', 'ocisly'])}],
+        })
+    return fixtures
+
+
+# Request handler: GET /v4/<resource>/<id> and GET /v4/launches
+class StubHandler(BaseHTTPRequestHandler):
+    fixtures = {}
+    latency = 0.0
+    jitter = 0.0
+    error_rate = 0.0
+    rate_limit = None
+    rng = random.Random()
+    bucket = None
+    lock = threading.Lock()
+
+    def do_GET(self):
+        parts = self.path.split('?', 1)[0].strip('/').split('/')
+
+        retry_after = self.take_token()
+        if retry_after:
+            self.send_json(429, {'error': 'Too Many Requests'}, {'Retry-After': '%.3f' % retry_after})
+            return
+
+        delay = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        if self.rng.random() < self.error_rate:
+            self.send_json(500, {'error': 'Injected failure'})
+            return
+
+        if parts == ['v4', 'launches'] and 'launches' in self.fixtures:
+            self.send_json(200, self.fixtures['launches'])
+        elif len(parts) == 3 and parts[0] == 'v4' and parts[2] in self.fixtures.get(parts[1], {}):
+            self.send_json(200, self.fixtures[parts[1]][parts[2]])
+        else:
+            self.send_json(404, {'error': 'Not Found'})
+
+    # Token bucket of rate_limit requests/second; returns seconds to wait when empty, else None
+    def take_token(self):
+        if not self.rate_limit:
+            return None
+        cls = type(self)
+        with cls.lock:
+            now = time.monotonic()
+            tokens, last = cls.bucket or (self.rate_limit, now)
+            tokens = min(self.rate_limit, tokens + (now - last) * self.rate_limit)
+            if tokens >= 1:
+                cls.bucket = (tokens - 1, now)
+                return None
+            cls.bucket = (tokens, now)
+            return (1 - tokens) / self.rate_limit
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Start the stand-in on a background thread; returns (server, base_url to pass as SPACEX_API_URL)
+def start_api_stub(fixtures, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=None, seed=None,
+                   host='127.0.0.1', port=0):
+    handler = type('BoundStubHandler', (StubHandler,), {
+        'fixtures': fixtures, 'latency': latency, 'jitter': jitter, 'error_rate': error_rate,
+        'rate_limit': rate_limit, 'rng': random.Random(seed), 'bucket': None, 'lock': threading.Lock()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, 'http://%s:%d/v4' % server.server_address[:2]
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve recorded SpaceX API fixtures locally")
+    parser.add_argument('--fixtures', help="directory of <resource>.json files (default: generated)")
+    parser.add_argument('--port', type=int, default=8900)
+    parser.add_argument('--latency', type=float, default=0.0, help="base seconds per response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="+/- seconds added to latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument('--rate-limit', type=float, default=None, help="requests/second before 429")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else generate_fixtures()
+    server, base_url = start_api_stub(fixtures, args.latency, args.jitter, args.error_rate, args.rate_limit,
+                                      port=args.port)
+    print("SpaceX API stand-in at", base_url)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
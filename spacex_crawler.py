@@ -0,0 +1,188 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Multi-revision launch table crawler
+# Purpose: Fetch many Falcon launch-list pages/revisions concurrently, parse them in a process pool, merge by vehicle and flight number
+# Key Concepts: bounded thread pool, conditional GET (ETag / Last-Modified), process pool parsing, deduplication
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import requests
+import pandas as pd
+
+from spacex_scrape import parse_launch_rows, LAUNCH_COLUMNS
+from spacex_schema import write_dataset
+
+WIKI_URL = "https://en.wikipedia.org/w/index.php"
+
+# (page title, revision id) pairs; None fetches the current revision.
+# The launch list was split into per-year pages; their rows share the Falcon 9 flight numbering.
+DEFAULT_TARGETS = [
+    ("List_of_Falcon_9_and_Falcon_Heavy_launches", "1027686922"),
+    ("List_of_Falcon_9_and_Falcon_Heavy_launches_(2010–2019)", None),
+    ("List_of_Falcon_9_and_Falcon_Heavy_launches_(2020–2022)", None),
+    ("List_of_Falcon_9_and_Falcon_Heavy_launches", None),
+    ("Falcon_Heavy", None),
+]
+
+# Pages whose tables number their own flights from 1; anything else counts as a Falcon 9 list
+VEHICLE_PAGES = {"Falcon_Heavy": "Falcon Heavy"}
+
+_local = threading.local()
+
+
+# One requests.Session per fetch thread so connections are reused
+def _session():
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+
+# Cache file stem for a target: readable title plus a short hash
+def _cache_key(title, oldid):
+    name = '%s_%s' % (title, oldid or 'latest')
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', name) + '_' + hashlib.md5(name.encode()).hexdigest()[:8]
+
+
+# Write a cache file through a temporary file in the same directory, so an interrupted write never
+# leaves a truncated page for a later 304 to serve
+def _write_atomic(path, text):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+# Fetch one page, revalidating a cached copy with If-None-Match / If-Modified-Since
+def fetch_page(title, oldid=None, base_url=WIKI_URL, cache_dir=None, timeout=30):
+    params = {'title': title}
+    if oldid:
+        params['oldid'] = oldid
+
+    headers = {}
+    meta = {}
+    stem = None
+    if cache_dir:
+        stem = os.path.join(cache_dir, _cache_key(title, oldid))
+        if os.path.exists(stem + '.json') and os.path.exists(stem + '.html'):
+            with open(stem + '.json') as f:
+                meta = json.load(f)
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+    response = _session().get(base_url, params=params, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        if stem is None:
+            raise requests.HTTPError("304 Not Modified for %s without a cached copy" % title, response=response)
+        with open(stem + '.html', encoding='utf-8') as f:
+            return f.read()
+    response.raise_for_status()
+
+    if cache_dir:
+        # Page first: validators are only stored once the page they describe is complete
+        _write_atomic(stem + '.html', response.text)
+        _write_atomic(stem + '.json', json.dumps({'etag': response.headers.get('ETag'),
+                                                  'last_modified': response.headers.get('Last-Modified')}))
+    return response.text
+
+
+# Fetch all targets with at most max_workers requests in flight; results keep target order
+def fetch_pages(targets, base_url=WIKI_URL, max_workers=8, cache_dir=None):
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda target: fetch_page(target[0], target[1], base_url, cache_dir), targets))
+
+
+# Parse the launch rows of every page in a process pool (BeautifulSoup is CPU bound)
+def parse_pages(pages, processes=None):
+    if processes == 1 or len(pages) <= 1:
+        return [parse_launch_rows(html) for html in pages]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(parse_launch_rows, pages))
+
+
+# Vehicle family whose flight numbering a page uses
+def page_vehicle(title):
+    return VEHICLE_PAGES.get(title, "Falcon 9")
+
+
+# Merge the rows of each target into one frame, one row per (vehicle, flight number);
+# later targets win on conflicts
+def merge_launches(targets, row_lists):
+    merged = {}
+    for (title, _), rows in zip(targets, row_lists):
+        vehicle = page_vehicle(title)
+        for row in rows:
+            merged[(vehicle, int(row['Flight No.']))] = dict(row, Vehicle=vehicle)
+    return pd.DataFrame([merged[key] for key in sorted(merged)], columns=['Vehicle'] + LAUNCH_COLUMNS)
+
+
+# Fetch, parse and merge a list of (title, oldid) targets
+def crawl(targets=DEFAULT_TARGETS, base_url=WIKI_URL, max_workers=8, processes=None, cache_dir=None):
+    pages = fetch_pages(targets, base_url, max_workers, cache_dir)
+    return merge_launches(targets, parse_pages(pages, processes))
+
+
+# Throughput benchmark against the local fixture server instead of Wikipedia
+def benchmark(n_pages=50, rows_per_page=100, latency=0.05, max_workers=8, processes=None):
+    import time
+    from spacex_fixture_server import build_launch_page, start_fixture_server
+
+    # Overlapping flight ranges so deduplication has work to do
+    pages = {}
+    targets = []
+    for i in range(n_pages):
+        oldid = str(1000000 + i)
+        first = i * rows_per_page // 2 + 1
+        pages[("List_of_Falcon_9_and_Falcon_Heavy_launches", oldid)] = \
+            build_launch_page(range(first, first + rows_per_page))
+        targets.append(("List_of_Falcon_9_and_Falcon_Heavy_launches", oldid))
+
+    server, base_url = start_fixture_server(pages, latency=latency)
+    try:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for label in ("cold cache", "warm cache"):
+                start = time.perf_counter()
+                df = crawl(targets, base_url, max_workers, processes, cache_dir)
+                elapsed = time.perf_counter() - start
+                print("%-10s %d pages, %d merged rows in %.2fs (%.1f pages/s)"
+                      % (label, n_pages, len(df), elapsed, n_pages / elapsed))
+        print("Requests served: %d, 304 Not Modified: %d"
+              % (server.RequestHandlerClass.request_count, server.RequestHandlerClass.not_modified_count))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Crawl Falcon launch-list revisions and merge them by vehicle and flight number")
+    parser.add_argument('targets', nargs='*', help="TITLE or TITLE:OLDID (default: pinned list, per-year lists, current pages)")
+    parser.add_argument('--base-url', default=WIKI_URL)
+    parser.add_argument('--workers', type=int, default=8, help="concurrent HTTP requests")
+    parser.add_argument('--processes', type=int, default=None, help="parser processes")
+    parser.add_argument('--cache-dir', default='.crawl_cache')
+    parser.add_argument('--output', default='spacex_web_scraped_history.csv')
+    parser.add_argument('--benchmark', action='store_true', help="run against the local fixture server")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(max_workers=args.workers, processes=args.processes)
+    else:
+        targets = [tuple(t.split(':', 1)) if ':' in t else (t, None) for t in args.targets] or DEFAULT_TARGETS
+        df = crawl(targets, args.base_url, args.workers, args.processes, args.cache_dir)
+        write_dataset(df, args.output, dataset='spacex_web_scraped')
+        print("Merged %d launches from %d pages into %s" % (len(df), len(targets), args.output))
@@ -0,0 +1,143 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Dashboard data access
+# Purpose: Serve the IBM 7 dashboard queries from an in-memory frame or from the SQLite database built by IBM 4
+# Key Concepts: read-only connections, per-process connection pool reopened on file replacement, parameterized indexed queries
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.request import pathname2url
+
+import pandas as pd
+
+# Table written by IBM 4 and its SQL column names for the dashboard CSV columns
+DASH_TABLE = "SPACEX_DASH"
+DASH_COLUMNS = {
+    'Flight Number': 'Flight_Number',
+    'Launch Site': 'Launch_Site',
+    'class': 'class',
+    'Payload Mass (kg)': 'Payload_Mass_kg',
+    'Booster Version': 'Booster_Version',
+    'Booster Version Category': 'Booster_Version_Category',
+}
+DASH_INDEXES = {
+    'idx_dash_site_payload': ('Launch_Site', 'Payload_Mass_kg'),
+    'idx_dash_payload': ('Payload_Mass_kg',),
+}
+
+# Fixed statements: sqlite3 keeps each connection's compiled statements in its cache,
+# so every pooled connection prepares these once and reuses them.
+SQL_SITES = "SELECT Launch_Site FROM SPACEX_DASH GROUP BY Launch_Site ORDER BY MIN(rowid)"
+SQL_PAYLOAD_BOUNDS = "SELECT MIN(Payload_Mass_kg), MAX(Payload_Mass_kg) FROM SPACEX_DASH"
+SQL_SUCCESS_BY_SITE = "SELECT Launch_Site, SUM(class) FROM SPACEX_DASH GROUP BY Launch_Site ORDER BY MIN(rowid)"
+SQL_SITE_OUTCOMES = ("SELECT class, COUNT(*) FROM SPACEX_DASH WHERE Launch_Site = ? "
+                     "GROUP BY class ORDER BY COUNT(*) DESC")
+SQL_PAYLOAD_ROWS = ("SELECT Payload_Mass_kg, class, Booster_Version_Category FROM SPACEX_DASH "
+                    "WHERE Payload_Mass_kg BETWEEN ? AND ? ORDER BY rowid")
+SQL_SITE_PAYLOAD_ROWS = ("SELECT Payload_Mass_kg, class, Booster_Version_Category FROM SPACEX_DASH "
+                         "WHERE Launch_Site = ? AND Payload_Mass_kg BETWEEN ? AND ? ORDER BY rowid")
+
+
+# Write the dashboard frame to SQLite with the indexes used by SqliteStore (called from IBM 4)
+def write_dash_table(df, conn):
+    df = df[list(DASH_COLUMNS)].rename(columns=DASH_COLUMNS)
+    df.to_sql(DASH_TABLE, conn, if_exists='replace', index=False, method="multi")
+    for name, columns in DASH_INDEXES.items():
+        conn.execute("CREATE INDEX IF NOT EXISTS %s ON %s (%s)" % (name, DASH_TABLE, ', '.join(columns)))
+    conn.commit()
+
+
+# Original behaviour: the whole CSV held in a DataFrame and filtered with pandas
+class FrameStore:
+    def __init__(self, df):
+        self.df = df
+
+    def launch_sites(self):
+        return list(self.df['Launch Site'].unique())
+
+    def payload_bounds(self):
+        return self.df['Payload Mass (kg)'].min(), self.df['Payload Mass (kg)'].max()
+
+    def success_by_site(self):
+        return self.df[['Launch Site', 'class']]
+
+    def site_outcomes(self, site):
+        filtered_df = self.df[self.df['Launch Site'] == site]
+        site_counts = filtered_df['class'].value_counts().reset_index()
+        site_counts.columns = ['class', 'count']
+        return site_counts
+
+    def payload_rows(self, site, low, high):
+        filtered_df = self.df[(self.df['Payload Mass (kg)'] >= low) &
+                              (self.df['Payload Mass (kg)'] <= high)]
+        if site != 'ALL':
+            filtered_df = filtered_df[filtered_df['Launch Site'] == site]
+        return filtered_df
+
+
+# Read-only SQLite backend: one small connection pool per worker process, shared on-disk data
+class SqliteStore:
+    def __init__(self, db_file, pool_size=4):
+        self.path = os.path.abspath(db_file)
+        self.uri = 'file:%s?mode=ro' % pathname2url(self.path)
+        self.pool_size = pool_size
+        self.pool = None
+        self.pid = None
+        self.file_id = None
+        self.lock = threading.Lock()
+
+    def connect(self):
+        conn = sqlite3.connect(self.uri, uri=True, check_same_thread=False, cached_statements=16)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    # Connections are opened lazily and reopened after a fork (gunicorn pre-fork workers) or when
+    # IBM 4 has moved a rebuilt database into place (new inode or modification time)
+    @contextmanager
+    def connection(self):
+        stat = os.stat(self.path)
+        file_id = (stat.st_ino, stat.st_mtime_ns)
+        with self.lock:
+            if self.pid != os.getpid() or self.file_id != file_id:
+                if self.pid == os.getpid():
+                    # Idle connections to the replaced file; busy ones go back to the old pool and are dropped
+                    while not self.pool.empty():
+                        self.pool.get_nowait().close()
+                self.pool = queue.Queue()
+                for _ in range(self.pool_size):
+                    self.pool.put(self.connect())
+                self.pid = os.getpid()
+                self.file_id = file_id
+            pool = self.pool
+        conn = pool.get()
+        try:
+            yield conn
+        finally:
+            pool.put(conn)
+
+    def query(self, sql, params=()):
+        with self.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def launch_sites(self):
+        return [site for (site,) in self.query(SQL_SITES)]
+
+    def payload_bounds(self):
+        return self.query(SQL_PAYLOAD_BOUNDS)[0]
+
+    def success_by_site(self):
+        return pd.DataFrame(self.query(SQL_SUCCESS_BY_SITE), columns=['Launch Site', 'class'])
+
+    def site_outcomes(self, site):
+        return pd.DataFrame(self.query(SQL_SITE_OUTCOMES, (site,)), columns=['class', 'count'])
+
+    def payload_rows(self, site, low, high):
+        if site == 'ALL':
+            rows = self.query(SQL_PAYLOAD_ROWS, (low, high))
+        else:
+            rows = self.query(SQL_SITE_PAYLOAD_ROWS, (site, low, high))
+        return pd.DataFrame(rows, columns=['Payload Mass (kg)', 'class', 'Booster Version Category'])
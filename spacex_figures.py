@@ -0,0 +1,85 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Compact dashboard figures
+# Purpose: Build the IBM 7 scatter chart as a small figure dict (WebGL for large data, typed arrays, viewport decimation)
+# Key Concepts: scattergl, plotly.js typed arrays (base64 bdata), relayoutData viewport, point decimation
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import base64
+
+import numpy as np
+import pandas as pd
+
+# Above this many points the chart switches from SVG scatter to WebGL scattergl
+WEBGL_THRESHOLD = 1000
+
+# Points outside the visible x range are thinned to at most this many (kept for panning context)
+MAX_OUTSIDE_POINTS = 500
+
+# plotly.js typed-array codes for the numpy dtypes used here (little-endian)
+TYPED_ARRAY_CODES = {'float32': 'f4', 'float64': 'f8', 'int8': 'i1', 'int16': 'i2', 'int32': 'i4'}
+
+# Plotly Express default colour sequence, so both figure modes look the same
+COLORWAY = ['#636efa', '#EF553B', '#00cc96', '#ab63fa', '#FFA15A',
+            '#19d3f3', '#FF6692', '#B6E880', '#FF97FF', '#FECB52']
+
+
+# Encode a numeric column as a plotly.js typed array instead of a JSON list of numbers
+def typed_array(values, dtype):
+    data = np.ascontiguousarray(values, dtype=np.dtype(dtype).newbyteorder('<'))
+    return {'dtype': TYPED_ARRAY_CODES[dtype], 'bdata': base64.b64encode(data.tobytes()).decode('ascii')}
+
+
+# Visible x range from a dcc.Graph relayoutData event, or None when autoscaled
+def viewport_from_relayout(relayout_data):
+    if not relayout_data or relayout_data.get('xaxis.autorange'):
+        return None
+    if 'xaxis.range[0]' in relayout_data:
+        return relayout_data['xaxis.range[0]'], relayout_data['xaxis.range[1]']
+    if 'xaxis.range' in relayout_data:
+        return tuple(relayout_data['xaxis.range'][:2])
+    return None
+
+
+# Keep every point inside the viewport and an evenly strided subset of the points outside it
+def decimate(df, x, viewport, max_outside=MAX_OUTSIDE_POINTS):
+    if viewport is None:
+        return df
+    low, high = sorted(viewport)
+    inside = df[x].between(low, high).to_numpy()
+    outside = np.flatnonzero(~inside)
+    if len(outside) > max_outside:
+        outside = outside[::int(np.ceil(len(outside) / max_outside))]
+    keep = np.sort(np.concatenate([np.flatnonzero(inside), outside]))
+    return df.iloc[keep]
+
+
+# Scatter chart with one trace per colour category, like px.scatter(df, x, y, color=color, title=title)
+# but serialized as a figure dict
+def compact_scatter(df, x, y, color, title, viewport=None, uirevision=None, webgl_threshold=WEBGL_THRESHOLD):
+    df = decimate(df, x, viewport)
+    trace_type = 'scattergl' if len(df) > webgl_threshold else 'scatter'
+
+    traces = []
+    for category in pd.unique(df[color]):
+        group = df[df[color] == category]
+        traces.append({
+            'type': trace_type,
+            'mode': 'markers',
+            'name': str(category),
+            'legendgroup': str(category),
+            'x': typed_array(group[x], 'float32'),
+            'y': typed_array(group[y], 'int8'),
+            'hovertemplate': '%s=%s<br>%s=%%{x}<br>%s=%%{y}<extra></extra>' % (color, category, x, y),
+        })
+
+    layout = {
+        'title': {'text': title},
+        'xaxis': {'title': {'text': x}},
+        'yaxis': {'title': {'text': y}},
+        'legend': {'title': {'text': color}},
+        'colorway': COLORWAY,
+        # Same uirevision keeps the user's zoom when the figure is rebuilt for a new viewport
+        'uirevision': uirevision,
+    }
+    return {'data': traces, 'layout': layout}
@@ -0,0 +1,129 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Local Wikipedia fixture server
+# Purpose: Serve recorded or generated launch-list pages so the crawler can be tested and benchmarked offline
+# Key Concepts: http.server, ETag / If-None-Match, synthetic launch tables
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import hashlib
+import os
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from spacex_scrape import LAUNCH_TABLE_CLASS
+
+# One launch row in the same cell layout as the real Wikipedia tables
+ROW_TEMPLATE = """<tr>
+<th scope="row">{flight}</th>
+<td>{day} June {year},<br/>{hour:02d}:45</td>
+<td><a href="/wiki/Falcon_9_v1.0">F9 v1.0</a><sup>[{flight}]</sup>B{serial}</td>
+<td><a href="/wiki/Cape_Canaveral">CCAFS</a></td>
+<td><a href="/wiki/Dragon">Payload {flight}</a></td>
+<td>{mass:,}&#160;kg</td>
+<td><a href="/wiki/Low_Earth_orbit">LEO</a></td>
+<td><a href="/wiki/SpaceX">SpaceX</a></td>
+<td>Success<sup>[1]</sup></td>
+<td>No attempt<sup>[2]</sup></td>
+</tr>
+"""
+
+
+# Build a launch-list page with one table holding the given flight numbers
+def build_launch_page(flight_numbers, title="List of Falcon 9 and Falcon Heavy launches"):
+    rows = ''.join(ROW_TEMPLATE.format(flight=n, day=n % 28 + 1, year=2010 + n // 40, hour=n % 24,
+                                       serial=1000 + n, mass=500 + 37 * n)
+                   for n in flight_numbers)
+    return ("<html><head><title>%s</title></head><body>"
+            "<table class=\"wikitable\"></table><table class=\"wikitable\"></table>"
+            "<table class=\"%s\"><tr><th>Flight No.</th><th>Date and<br/>time (<a>UTC</a>)</th>"
+            "<th>Version,<br/>Booster</th><th>Launch site</th><th>Payload</th><th>Payload mass</th>"
+            "<th>Orbit</th><th>Customer</th><th>Launch<br/>outcome</th><th>Booster<br/>landing</th></tr>"
+            "%s</table></body></html>" % (title, LAUNCH_TABLE_CLASS, rows))
+
+
+# Request handler: GET /w/index.php?title=<title>[&oldid=<revision>]
+class FixtureHandler(BaseHTTPRequestHandler):
+    pages = {}
+    fixture_dir = None
+    latency = 0.0
+    request_count = 0
+    not_modified_count = 0
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        title = query.get('title', [''])[0]
+        oldid = query.get('oldid', [None])[0]
+        body = self.find_page(title, oldid)
+
+        if self.latency:
+            time.sleep(self.latency)
+        type(self).request_count += 1
+
+        if body is None:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = body.encode('utf-8') if isinstance(body, str) else body
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            type(self).not_modified_count += 1
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', formatdate(usegmt=True))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Look up in-memory pages first, then <fixture_dir>/<title>[_<oldid>].html
+    def find_page(self, title, oldid):
+        if (title, oldid) in self.pages:
+            return self.pages[(title, oldid)]
+        if self.fixture_dir:
+            name = title if oldid is None else '%s_%s' % (title, oldid)
+            path = os.path.join(self.fixture_dir, name + '.html')
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    return f.read()
+        return None
+
+    def log_message(self, format, *args):
+        pass
+
+
+# Start the server on a background thread; returns (server, base_url for the crawler)
+def start_fixture_server(pages=None, fixture_dir=None, latency=0.0, host='127.0.0.1', port=0):
+    handler = type('BoundFixtureHandler', (FixtureHandler,),
+                   {'pages': dict(pages or {}), 'fixture_dir': fixture_dir, 'latency': latency})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = 'http://%s:%d/w/index.php' % server.server_address[:2]
+    return server, base_url
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve launch-list fixtures in place of en.wikipedia.org")
+    parser.add_argument('fixture_dir', help="directory of <title>[_<oldid>].html files")
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    args = parser.parse_args()
+
+    server, base_url = start_fixture_server(fixture_dir=args.fixture_dir, latency=args.latency, port=args.port)
+    print("Serving fixtures at", base_url)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,213 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Incremental model refresh
+# Purpose: Update the landing classifiers from newly appended launches instead of retraining on the full history
+# Key Concepts: running moments for drift, partial_fit (SGD logistic / linear SVM), append-only KNN, drift-triggered refit
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import copy
+import os
+import pickle
+import time
+
+import numpy as np
+from sklearn import preprocessing
+from sklearn.base import clone
+from sklearn.model_selection import GridSearchCV
+from sklearn.linear_model import SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.neighbors import KNeighborsClassifier
+
+from spacex_schema import read_dataset
+
+STATE_FILE = "spacex_models.pkl"
+
+# The scaler the models were trained with is only refitted on a full refit, so the stored KNN samples,
+# the SGD weights and new launches all stay in one scaled space. Running moments of every launch seen
+# are tracked separately and only feed the drift check: a full refit happens when the running feature
+# means have moved more than this many standard deviations from the model scaler, or when a model's
+# accuracy on the new launches falls this far below its cross-validation score (only judged on at
+# least DRIFT_MIN_LAUNCHES launches)
+DRIFT_MEAN_SHIFT = 0.25
+DRIFT_ACCURACY_DROP = 0.15
+DRIFT_MIN_LAUNCHES = 10
+
+# Index and counter columns grow with every launch by construction, so their means always move;
+# they are left out of the mean-shift check (the accuracy check still sees them)
+DRIFT_IGNORED_COLUMNS = ('FlightNumber', 'Flights', 'ReusedCount', 'Block')
+
+CLASSES = np.array([0, 1])
+
+
+# Models with their GridSearchCV grids (used on full refits only).
+# SGD with log/hinge loss stands in for LogisticRegression/SVC because it supports partial_fit;
+# brute-force KNN has no index to rebuild, fitting only stores the samples.
+def build_models():
+    sgd_grid = {'alpha': [1e-4, 1e-3, 1e-2, 1e-1]}
+    return {
+        "Logistic Regression (SGD)": (SGDClassifier(loss='log_loss', random_state=2), sgd_grid),
+        "Linear SVM (SGD)": (SGDClassifier(loss='hinge', random_state=2), sgd_grid),
+        "Decision Tree": (DecisionTreeClassifier(random_state=2),
+                          {'criterion': ['gini', 'entropy'], 'max_depth': list(range(1, 10))}),
+        "KNN": (KNeighborsClassifier(algorithm='brute'), {'n_neighbors': list(range(1, 11)), 'p': [1, 2]}),
+    }
+
+
+# Retrain the scaler and every model on the full history
+def full_refit(X, y):
+    scaler = preprocessing.StandardScaler()
+    X_scaled = scaler.fit_transform(X.to_numpy(dtype='float64'))
+    cv = max(2, min(10, np.bincount(y, minlength=2).min()))
+
+    models, baseline = {}, {}
+    for name, (model, parameters) in build_models().items():
+        search = GridSearchCV(model, parameters, cv=cv)
+        search.fit(X_scaled, y)
+        models[name] = search.best_estimator_
+        baseline[name] = search.best_score_
+
+    return {
+        'columns': list(X.columns),
+        'n_rows': len(X),
+        'scaler': scaler,
+        'moments': copy.deepcopy(scaler),
+        'models': models,
+        'baseline': baseline,
+        'X_scaled': X_scaled,
+        'y': np.asarray(y),
+    }
+
+
+# 0/1 indicator column, as produced by get_dummies in IBM 5
+def is_indicator(values):
+    return bool(np.isin(values, (0, 1)).all())
+
+
+# Drift of the new launches relative to the state: unseen columns, mean shift, accuracy drop.
+# Unseen indicator columns (e.g. the first launch of a new booster serial) are handled by
+# incremental_update; only unseen columns of any other kind count as drift.
+def drift_metrics(state, X_new, y_new):
+    unseen = [column for column in X_new.columns if column not in state['columns']]
+    unseen_other = [column for column in unseen if not is_indicator(X_new[column].to_numpy())]
+    X_new = X_new.reindex(columns=state['columns'], fill_value=0).to_numpy(dtype='float64')
+
+    # Where the running means would land after this delta, measured against the model scaler
+    moments, scaler = state['moments'], state['scaler']
+    checked = np.array([column not in DRIFT_IGNORED_COLUMNS for column in state['columns']])
+    n_seen = moments.n_samples_seen_
+    merged_mean = (moments.mean_ * n_seen + X_new.sum(axis=0)) / (n_seen + len(X_new))
+    shift = np.abs(merged_mean - scaler.mean_) / scaler.scale_
+    mean_shift = float(shift[checked].max()) if checked.any() else 0.0
+
+    accuracy_drop = 0.0
+    if len(X_new) >= DRIFT_MIN_LAUNCHES:
+        X_scaled = scaler.transform(X_new)
+        accuracy_drop = max(state['baseline'][name] - model.score(X_scaled, y_new)
+                            for name, model in state['models'].items())
+    return {'unseen_columns': unseen, 'unseen_other': unseen_other, 'mean_shift': mean_shift,
+            'accuracy_drop': float(accuracy_drop)}
+
+
+def needs_full_refit(metrics):
+    return (bool(metrics['unseen_other'])
+            or metrics['mean_shift'] > DRIFT_MEAN_SHIFT
+            or metrics['accuracy_drop'] > DRIFT_ACCURACY_DROP)
+
+
+# Add indicator columns that are all zero in the history. A zero column scales to zero with mean 0 /
+# scale 1, so the SGD models get a zero weight for it and the stored KNN samples a zero column;
+# the decision tree is refitted on the stored history with its tuned parameters (no grid search).
+def extend_columns(state, columns):
+    k = len(columns)
+    state['columns'] = state['columns'] + list(columns)
+    for scaler in (state['scaler'], state['moments']):
+        scaler.mean_ = np.concatenate([scaler.mean_, np.zeros(k)])
+        scaler.var_ = np.concatenate([scaler.var_, np.zeros(k)])
+        scaler.scale_ = np.concatenate([scaler.scale_, np.ones(k)])
+        scaler.n_features_in_ += k
+    state['X_scaled'] = np.hstack([state['X_scaled'], np.zeros((len(state['X_scaled']), k))])
+
+    for name, model in state['models'].items():
+        if hasattr(model, 'partial_fit'):
+            model.coef_ = np.hstack([model.coef_, np.zeros((model.coef_.shape[0], k))])
+            model.n_features_in_ += k
+        else:
+            state['models'][name] = clone(model).fit(state['X_scaled'], state['y'])
+    return state
+
+
+# Fold the new launches into the state; cost is proportional to the delta except the KNN sample copy
+# (and the small decision tree refit when new indicator columns appear)
+def incremental_update(state, X_new, y_new):
+    unseen = [column for column in X_new.columns if column not in state['columns']]
+    if unseen:
+        extend_columns(state, unseen)
+    X_new = X_new.reindex(columns=state['columns'], fill_value=0).to_numpy(dtype='float64')
+    y_new = np.asarray(y_new)
+
+    # StandardScaler.partial_fit merges the delta's mean/variance into the running moments;
+    # the delta itself is scaled like the history, with the scaler from the last full refit
+    state['moments'].partial_fit(X_new)
+    X_scaled = state['scaler'].transform(X_new)
+
+    for model in state['models'].values():
+        if hasattr(model, 'partial_fit'):
+            model.partial_fit(X_scaled, y_new, classes=CLASSES)
+
+    # KNN: append the new samples; brute-force fitting only stores them
+    state['X_scaled'] = np.vstack([state['X_scaled'], X_scaled])
+    state['y'] = np.concatenate([state['y'], y_new])
+    state['models']['KNN'].fit(state['X_scaled'], state['y'])
+
+    state['n_rows'] += len(X_new)
+    return state
+
+
+# Load features/labels, work out the appended rows and refresh the saved models
+def refresh(features_csv="dataset_part_3.csv", labels_csv="dataset_part_2.csv", state_file=STATE_FILE,
+            force_full=False):
+    X = read_dataset(features_csv, dataset='dataset_part_3')
+    y = read_dataset(labels_csv, dataset='dataset_part_2')['Class'].to_numpy()
+
+    state = None
+    if os.path.exists(state_file) and not force_full:
+        with open(state_file, 'rb') as f:
+            state = pickle.load(f)
+
+    start = time.perf_counter()
+    if state is None or len(X) < state['n_rows']:
+        action = "full refit (no usable saved state)"
+        state = full_refit(X, y)
+    elif len(X) == state['n_rows']:
+        print("Models are up to date (%d launches)" % len(X))
+        return state
+    else:
+        X_new, y_new = X.iloc[state['n_rows']:], y[state['n_rows']:]
+        metrics = drift_metrics(state, X_new, y_new)
+        print("Drift on %d new launches: mean shift %.2f sd, accuracy drop %.2f, unseen columns %d"
+              % (len(X_new), metrics['mean_shift'], metrics['accuracy_drop'], len(metrics['unseen_columns'])))
+        if needs_full_refit(metrics):
+            action = "full refit (drift threshold crossed)"
+            state = full_refit(X, y)
+        else:
+            action = "incremental update with %d launches" % len(X_new)
+            state = incremental_update(state, X_new, y_new)
+    elapsed = time.perf_counter() - start
+
+    with open(state_file, 'wb') as f:
+        pickle.dump(state, f)
+    print("%s: %.2fs, %d launches in the model state" % (action, elapsed, state['n_rows']))
+    return state
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Refresh the landing classifiers from newly appended launches")
+    parser.add_argument('--features', default="dataset_part_3.csv")
+    parser.add_argument('--labels', default="dataset_part_2.csv")
+    parser.add_argument('--state', default=STATE_FILE)
+    parser.add_argument('--full', action='store_true', help="ignore the saved state and retrain everything")
+    args = parser.parse_args()
+
+    refresh(args.features, args.labels, args.state, args.full)
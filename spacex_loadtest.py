@@ -0,0 +1,89 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Enrichment load test
+# Purpose: Run the IBM 1 enrichment stage against the local SpaceX API stand-in and report performance
+# Key Concepts: repeatable fixtures, concurrent runs, throughput, latency percentiles, retry counts
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from spacex_api import enrich_launches, new_stats, select_launch, LAUNCH_FIELDS
+from spacex_api_stub import generate_fixtures, load_fixtures, start_api_stub
+
+
+# Same projection and single-core/single-payload filter as IBM 1
+def prepare_launches(launches):
+    selected = [launch for launch in map(select_launch, launches) if launch is not None]
+    return pd.DataFrame(selected, columns=LAUNCH_FIELDS + ['date'])
+
+
+# One enrichment run with its own statistics record
+def run_once(data, base_url):
+    stats = new_stats()
+    try:
+        enrich_launches(data, base_url, stats=stats)
+        stats['failed'] = False
+    except Exception:
+        stats['failed'] = True
+    return stats
+
+
+# Run the enrichment `runs` times, `concurrency` at a time, and return the merged statistics
+def load_test(fixtures, runs=5, concurrency=1, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit=None, seed=0):
+    data = prepare_launches(fixtures['launches'])
+    server, base_url = start_api_stub(fixtures, latency, jitter, error_rate, rate_limit, seed)
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda _: run_once(data, base_url), range(runs)))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    # Only completed runs count towards enriched launches
+    failed = sum(result['failed'] for result in results)
+    report = new_stats()
+    report.update(runs=runs, launches=len(data) * (runs - failed), elapsed=elapsed, failed=failed)
+    for result in results:
+        for key in ('requests', 'retries', 'rate_limited', 'errors'):
+            report[key] += result[key]
+        report['latencies'].extend(result['latencies'])
+    return report
+
+
+def print_report(report):
+    latencies_ms = np.array(report['latencies']) * 1000
+    print("Runs: %d (%d failed), %d launches enriched in %.2fs"
+          % (report['runs'], report['failed'], report['launches'], report['elapsed']))
+    print("Throughput: %.1f launches/s, %.1f requests/s"
+          % (report['launches'] / report['elapsed'], report['requests'] / report['elapsed']))
+    if len(latencies_ms):
+        p50, p90, p99 = np.percentile(latencies_ms, [50, 90, 99])
+        print("Latency (ms): p50 %.1f  p90 %.1f  p99 %.1f  max %.1f" % (p50, p90, p99, latencies_ms.max()))
+    print("Requests: %d, retries: %d (429: %d, 5xx: %d)"
+          % (report['requests'], report['retries'], report['rate_limited'], report['errors']))
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load-test the SpaceX API enrichment against a local stand-in")
+    parser.add_argument('--fixtures', help="recorded fixture directory (default: generated)")
+    parser.add_argument('--launches', type=int, default=100, help="generated launches when no fixtures given")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--concurrency', type=int, default=1, help="enrichment runs in parallel")
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--jitter', type=float, default=0.01)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None, help="requests/second before 429")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures) if args.fixtures else generate_fixtures(args.launches, args.seed)
+    report = load_test(fixtures, args.runs, args.concurrency, args.latency, args.jitter,
+                       args.error_rate, args.rate_limit, args.seed)
+    print_report(report)
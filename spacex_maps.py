@@ -0,0 +1,231 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Per-site launch maps
+# Purpose: Build one small Folium map per launch site in parallel, GeoJSON sidecars, and an index map that loads them on demand
+# Key Concepts: process pool, per-site content hashes for incremental rebuilds, lazy-loaded GeoJSON layers
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from math import sin, cos, sqrt, atan2, radians
+
+import pandas as pd
+import folium
+from branca.element import MacroElement
+from folium.plugins import MarkerCluster, MousePosition
+from folium.features import DivIcon
+from jinja2 import Template
+
+NASA_COORDINATE = [29.559684888503615, -95.0830971930759]
+
+# Example from IBM 6: distance from LC-40 to the nearest coastline point
+COASTLINE_EXAMPLE = ((28.562302, -80.577356), (28.56367, -80.57163))
+
+MANIFEST = "manifest.json"
+
+# Browser function shared by the site and index pages: fetch a site's GeoJSON sidecar into a marker cluster
+LOAD_LAUNCHES_JS = """
+            function loadLaunches(map, url) {
+                fetch(url).then(function(response) { return response.json(); }).then(function(data) {
+                    var cluster = L.markerClusterGroup();
+                    cluster.addLayer(L.geoJSON(data, {pointToLayer: function(feature, latlng) {
+                        return L.marker(latlng, {icon: L.AwesomeMarkers.icon({
+                            markerColor: feature.properties.marker_color, icon: 'info-sign', prefix: 'glyphicon'})});
+                    }}));
+                    cluster.addTo(map);
+                });
+            }"""
+
+
+# Distance calculation function (Haversine formula)
+def calculate_distance(lat1, lon1, lat2, lon2):
+    R = 6373.0
+    lat1, lon1, lat2, lon2 = map(radians, [lat1, lon1, lat2, lon2])
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    return R * c
+
+
+# File-name friendly version of a launch site name
+def site_slug(site):
+    return re.sub(r'[^A-Za-z0-9]+', '_', site).strip('_')
+
+
+# Site label in the same style as IBM 6
+def site_label(lat, lon, text):
+    return folium.map.Marker(
+        [lat, lon],
+        icon=DivIcon(icon_size=(20,20), icon_anchor=(0,0),
+                     html='<div style="font-size: 12; color:#d35400;"><b>%s</b></div>' % text))
+
+
+# Launch points of one site as a GeoJSON FeatureCollection
+def site_geojson(site_df):
+    return {
+        'type': 'FeatureCollection',
+        'features': [{
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [float(lon), float(lat)]},
+            'properties': {'class': int(launch_class), 'marker_color': 'green' if launch_class == 1 else 'red'},
+        } for lat, lon, launch_class in zip(site_df['Lat'], site_df['Long'], site_df['class'])],
+    }
+
+
+# Build <slug>.html and <slug>.geojson for one site (runs in a worker process)
+def build_site(site, site_df, out_dir):
+    lat, lon = site_df['Lat'].iloc[0], site_df['Long'].iloc[0]
+    slug = site_slug(site)
+
+    site_map = folium.Map(location=[lat, lon], zoom_start=13)
+    folium.Circle([lat, lon], radius=1000, color='blue', fill=True).add_child(folium.Popup(site)).add_to(site_map)
+    site_label(lat, lon, site).add_to(site_map)
+
+    # Launch markers come from the GeoJSON sidecar; the empty cluster puts the MarkerCluster library on the page
+    MarkerCluster().add_to(site_map)
+    site_map.add_child(SiteLaunchLayer(slug + '.geojson'))
+
+    formatter = "function(num) {return L.Util.formatNum(num, 5);};"
+    site_map.add_child(MousePosition(position='topright', separator=' Long: ', prefix='Lat:',
+                                     lat_formatter=formatter, lng_formatter=formatter))
+
+    # Distance line from the IBM 6 example, on the map of the site it starts from
+    (launch_site_lat, launch_site_lon), (coastline_lat, coastline_lon) = COASTLINE_EXAMPLE
+    if calculate_distance(lat, lon, launch_site_lat, launch_site_lon) < 0.05:
+        distance = calculate_distance(launch_site_lat, launch_site_lon, coastline_lat, coastline_lon)
+        site_label(coastline_lat, coastline_lon, '%.2f KM' % distance).add_to(site_map)
+        site_map.add_child(folium.PolyLine(locations=[[launch_site_lat, launch_site_lon],
+                                                      [coastline_lat, coastline_lon]], weight=2))
+
+    site_map.save(os.path.join(out_dir, slug + '.html'))
+    with open(os.path.join(out_dir, slug + '.geojson'), 'w') as f:
+        json.dump(site_geojson(site_df), f)
+    return site
+
+
+# Site page script: cluster the site's launches from its sidecar
+class SiteLaunchLayer(MacroElement):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function() {
+            {{ this.load_launches_js }}
+            loadLaunches({{ this._parent.get_name() }}, {{ this.geojson_json }});
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, geojson):
+        super().__init__()
+        self._name = 'SiteLaunchLayer'
+        self.load_launches_js = LOAD_LAUNCHES_JS
+        self.geojson_json = json.dumps(geojson)
+
+
+# Index page script: one circle per site; a site's launches are fetched from its sidecar on first open
+class LazySiteLayers(MacroElement):
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+        (function() {
+            var map = {{ this._parent.get_name() }};
+            var loaded = {};
+            {{ this.load_launches_js }}
+            {{ this.sites_json }}.forEach(function(site) {
+                var circle = L.circle([site.lat, site.lon], {radius: 1000, color: 'blue', fill: true}).addTo(map);
+                L.marker([site.lat, site.lon], {icon: L.divIcon({iconSize: [20, 20], iconAnchor: [0, 0],
+                    html: '<div style="font-size: 12; color:#d35400;"><b>' + site.name + '</b></div>'})}).addTo(map);
+                circle.bindPopup('<b>' + site.name + '</b><br><a href="' + site.page + '" target="_blank">Open site map</a>');
+                circle.on('popupopen', function() {
+                    if (loaded[site.name]) { return; }
+                    loaded[site.name] = true;
+                    loadLaunches(map, site.geojson);
+                });
+            });
+        })();
+        {% endmacro %}
+    """)
+
+    def __init__(self, sites):
+        super().__init__()
+        self._name = 'LazySiteLayers'
+        self.load_launches_js = LOAD_LAUNCHES_JS
+        self.sites_json = json.dumps(sites)
+
+
+# Small index map: site circles and labels only, launch layers loaded lazily
+def build_index(launch_sites_df, out_dir, index_file='index.html'):
+    index_map = folium.Map(location=NASA_COORDINATE, zoom_start=5)
+    # Empty cluster so the MarkerCluster library is on the page for the lazy layers
+    MarkerCluster().add_to(index_map)
+    sites = [{'name': row['Launch Site'], 'lat': float(row['Lat']), 'lon': float(row['Long']),
+              'page': site_slug(row['Launch Site']) + '.html',
+              'geojson': site_slug(row['Launch Site']) + '.geojson'}
+             for _, row in launch_sites_df.iterrows()]
+    index_map.add_child(LazySiteLayers(sites))
+    index_map.save(os.path.join(out_dir, index_file))
+
+
+# Content hash of one site's launches; unchanged hash means the site files are still current
+def site_hash(site_df):
+    return hashlib.md5(pd.util.hash_pandas_object(site_df, index=False).values.tobytes()).hexdigest()
+
+
+# Build (or refresh) the per-site maps and the index; returns the list of rebuilt sites
+def build_site_maps(spacex_df, out_dir='spacex_map_sites', processes=None, force=False):
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    groups = {site: site_df for site, site_df in spacex_df.groupby('Launch Site', sort=False, observed=True)}
+    hashes = {site: site_hash(site_df) for site, site_df in groups.items()}
+    stale = [site for site in groups
+             if force or manifest.get('sites', {}).get(site) != hashes[site]
+             or not all(os.path.exists(os.path.join(out_dir, site_slug(site) + extension))
+                        for extension in ('.html', '.geojson'))]
+
+    # Sites that are no longer in the data: drop their pages (the manifest below lists current sites only)
+    current_slugs = {site_slug(site) for site in groups}
+    for site in manifest.get('sites', {}):
+        if site not in groups and site_slug(site) not in current_slugs:
+            for extension in ('.html', '.geojson'):
+                path = os.path.join(out_dir, site_slug(site) + extension)
+                if os.path.exists(path):
+                    os.remove(path)
+
+    if stale:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            list(pool.map(build_site, stale, [groups[site] for site in stale], [out_dir] * len(stale)))
+
+    launch_sites_df = spacex_df.groupby('Launch Site', as_index=False, sort=False, observed=True).first()
+    launch_sites_df = launch_sites_df[['Launch Site', 'Lat', 'Long']]
+    index_hash = site_hash(launch_sites_df)
+    if force or manifest.get('index') != index_hash or not os.path.exists(os.path.join(out_dir, 'index.html')):
+        build_index(launch_sites_df, out_dir)
+
+    with open(manifest_path, 'w') as f:
+        json.dump({'sites': hashes, 'index': index_hash}, f, indent=1)
+    return stale
+
+
+if __name__ == '__main__':
+    import argparse
+    from spacex_schema import read_dataset
+
+    parser = argparse.ArgumentParser(description="Build per-site launch maps and a lazy-loading index map")
+    parser.add_argument('--data', default="spacex_launch_geo.csv")
+    parser.add_argument('--out-dir', default="spacex_map_sites")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--force', action='store_true', help="rebuild every site")
+    args = parser.parse_args()
+
+    rebuilt = build_site_maps(read_dataset(args.data, dataset='spacex_launch_geo'), args.out_dir,
+                              args.processes, args.force)
+    print("Rebuilt %d site map(s): %s" % (len(rebuilt), ', '.join(rebuilt) or '-'))
+    print("Serve %s over HTTP (e.g. python -m http.server) and open index.html;"
+          " browsers block the GeoJSON sidecars on file:// pages." % args.out_dir)
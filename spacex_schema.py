@@ -0,0 +1,122 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Shared dtype schemas
+# Purpose: Declare compact column dtypes per dataset and apply them on every CSV load/save
+# Key Concepts: categorical columns, downcast numerics, nullable booleans, datetime parsing
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import pandas as pd
+
+# Dtype per column for each dataset, keyed by CSV base name.
+# 'datetime' is parsed with pd.to_datetime, everything else goes through astype.
+# Columns missing from a frame are skipped; '*' applies to all undeclared columns.
+SCHEMAS = {
+    # Output of IBM 1 (SpaceX API)
+    'dataset_part_1': {
+        'FlightNumber': 'int16',
+        'Date': 'datetime',
+        'BoosterVersion': 'category',
+        'PayloadMass': 'float64',
+        'Orbit': 'category',
+        'LaunchSite': 'category',
+        'Outcome': 'category',
+        'Flights': 'int8',
+        'GridFins': 'boolean',
+        'Reused': 'boolean',
+        'Legs': 'boolean',
+        'LandingPad': 'category',
+        'Block': 'Int8',
+        'ReusedCount': 'Int8',
+        'Serial': 'category',
+        'Longitude': 'float64',
+        'Latitude': 'float64',
+    },
+    # Output of IBM 2 (Wikipedia scrape)
+    'spacex_web_scraped': {
+        'Vehicle': 'category',
+        'Flight No.': 'int16',
+        'Launch site': 'category',
+        'Orbit': 'category',
+        'Customer': 'category',
+        'Launch outcome': 'category',
+        'Version Booster': 'category',
+        'Booster landing': 'category',
+    },
+    # Course copy of the launch table used by IBM 4 (Date stays text for the SQL queries)
+    'Spacex': {
+        'Booster_Version': 'category',
+        'Launch_Site': 'category',
+        'PAYLOAD_MASS__KG_': 'Int32',
+        'Orbit': 'category',
+        'Customer': 'category',
+        'Mission_Outcome': 'category',
+        'Landing_Outcome': 'category',
+    },
+    # One-hot features from IBM 5, read by IBM 8 (payload mass keeps full precision)
+    'dataset_part_3': {
+        'PayloadMass': 'float64',
+        '*': 'float32',
+    },
+    # Geo and dashboard extracts used by IBM 6 and IBM 7
+    'spacex_launch_geo': {
+        'Launch Site': 'category',
+        'class': 'int8',
+        'Lat': 'float64',
+        'Long': 'float64',
+    },
+    'spacex_launch_dash': {
+        'Flight Number': 'int16',
+        'Launch Site': 'category',
+        'class': 'int8',
+        'Payload Mass (kg)': 'float64',
+        'Booster Version': 'category',
+        'Booster Version Category': 'category',
+    },
+}
+
+# IBM 3 adds the landing label on top of the IBM 1 columns
+SCHEMAS['dataset_part_2'] = dict(SCHEMAS['dataset_part_1'], Class='int8')
+
+
+# Resolve the schema for a dataset name or a file path/URL ending in <name>.csv
+def get_schema(dataset):
+    name = str(dataset).rsplit('/', 1)[-1]
+    if name.endswith('.csv'):
+        name = name[:-4]
+    if name not in SCHEMAS:
+        raise KeyError("No dtype schema registered for dataset '%s'" % name)
+    return SCHEMAS[name]
+
+
+# Return a copy of df with its columns cast to the dataset schema
+def apply_schema(df, dataset):
+    schema = get_schema(dataset)
+    default = schema.get('*')
+    df = df.copy()
+    for column in df.columns:
+        dtype = schema.get(column, default)
+        if dtype is None or str(df[column].dtype) == dtype:
+            continue
+        if dtype == 'datetime':
+            df[column] = pd.to_datetime(df[column])
+        else:
+            df[column] = df[column].astype(dtype)
+    return df
+
+
+# pd.read_csv wrapper: reads with the declared dtypes instead of object/float64
+def read_dataset(path, dataset=None, **kwargs):
+    schema = get_schema(dataset or path)
+    read_dtypes = {column: dtype for column, dtype in schema.items()
+                   if column != '*' and dtype == 'category'}
+    df = pd.read_csv(path, dtype=read_dtypes, **kwargs)
+    return apply_schema(df, dataset or path)
+
+
+# DataFrame.to_csv wrapper: casts to the schema first so every writer produces the same layout
+def write_dataset(df, path, dataset=None, **kwargs):
+    df = apply_schema(df, dataset or path)
+    kwargs.setdefault('index', False)
+    kwargs.setdefault('date_format', '%Y-%m-%d')
+    df.to_csv(path, **kwargs)
+    return df
@@ -0,0 +1,97 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Wikipedia table helpers
+# Purpose: Cell helpers and row extraction for the Falcon 9 launch tables (used by IBM 2 and the crawler)
+# Key Concepts: BeautifulSoup parsing, table cell cleaning, row dictionaries
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+from bs4 import BeautifulSoup
+import unicodedata
+
+# Class of the per-period launch tables on the list pages
+LAUNCH_TABLE_CLASS = "wikitable plainrowheaders collapsible"
+
+# Output columns, in the order IBM 2 writes them
+LAUNCH_COLUMNS = ['Flight No.', 'Launch site', 'Payload', 'Payload mass', 'Orbit', 'Customer',
+                  'Launch outcome', 'Version Booster', 'Booster landing', 'Date', 'Time']
+
+# Helper function: extract date and time from table cell
+def date_time(table_cells):
+    return [data_time.strip() for data_time in list(table_cells.strings)][0:2]
+
+# Helper function: extract booster version string
+def booster_version(table_cells):
+    out = ''.join([booster_version for i, booster_version in enumerate(table_cells.strings) if i % 2 == 0][0:-1])
+    return out
+
+# Helper function: extract landing status from cell
+def landing_status(table_cells):
+    out = [i for i in table_cells.strings][0]
+    return out
+
+# Helper function: clean payload mass value (extract in kg)
+def get_mass(table_cells):
+    mass = unicodedata.normalize("NFKD", table_cells.text).strip()
+    if mass:
+        mass.find("kg")
+        new_mass = mass[0:mass.find("kg") + 2]
+    else:
+        new_mass = 0
+    return new_mass
+
+# Helper function: extract and clean column name from header
+def extract_column_from_header(row):
+    if row.br:
+        row.br.extract()
+    if row.a:
+        row.a.extract()
+    if row.sup:
+        row.sup.extract()
+    colunm_name = ' '.join(row.contents)
+    if not (colunm_name.strip().isdigit()):
+        colunm_name = colunm_name.strip()
+        return colunm_name
+
+# Convert a parsed cell value to a plain string, keeping None
+def _text(value):
+    return None if value is None else str(value)
+
+# Extract one dictionary per launch row from all launch tables of a page
+def parse_launch_rows(soup):
+    if isinstance(soup, (str, bytes)):
+        soup = BeautifulSoup(soup, 'html.parser')
+
+    launches = []
+    flag = False
+    for table in soup.find_all('table', LAUNCH_TABLE_CLASS):
+        for rows in table.find_all("tr"):
+            if rows.th:
+                if rows.th.string:
+                    flight_number = rows.th.string.strip()
+                    flag = flight_number.isdigit()
+            else:
+                flag = False
+
+            row = rows.find_all('td')
+            if flag:
+                datatimelist = date_time(row[0])
+
+                bv = booster_version(row[1])
+                if not bv:
+                    bv = row[1].a.string
+
+                # Plain str values so rows can be pickled across processes (NavigableString keeps the tree)
+                launches.append({
+                    'Flight No.': _text(flight_number),
+                    'Launch site': _text(row[2].a.string),
+                    'Payload': _text(row[3].a.string),
+                    'Payload mass': get_mass(row[4]),
+                    'Orbit': _text(row[5].a.string),
+                    'Customer': _text(row[6].a.string),
+                    'Launch outcome': _text(list(row[7].strings)[0]),
+                    'Version Booster': _text(bv),
+                    'Booster landing': _text(landing_status(row[8])),
+                    'Date': _text(datatimelist[0].strip(',')),
+                    'Time': _text(datatimelist[1]),
+                })
+    return launches
@@ -0,0 +1,61 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Streaming JSON decoder tests
+# Purpose: Check iter_json_array against json.loads for every chunk split, and its errors on malformed arrays
+# Key Concepts: pytest parametrize, chunk boundaries inside strings and numbers, strict array syntax
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import json
+
+import pytest
+
+from spacex_api import iter_json_array
+
+DOCUMENT = ('[ {"flight_number": 12, "name": "CRS-\\u00e9 [1], {x}", "cores": [{"core": null}]},\n'
+            ' -2.5e-3, 1234567, "tail \\"quoted\\"", true, false, null, [], {} ]\n')
+
+
+# Every way of cutting text into two chunks, plus one character per chunk
+def splits(text):
+    for cut in range(len(text) + 1):
+        yield [text[:cut], text[cut:]]
+    yield list(text)
+
+
+def test_matches_json_loads_for_every_chunk_boundary():
+    expected = json.loads(DOCUMENT)
+    for chunks in splits(DOCUMENT):
+        assert list(iter_json_array(chunks)) == expected, chunks
+
+
+def test_number_split_across_chunks():
+    assert list(iter_json_array(['[12', '34.', '5e', '1]'])) == [12345.0]
+    assert list(iter_json_array(['[7, 8', '9'] + [']'])) == [7, 89]
+
+
+def test_bytes_chunks_and_empty_array():
+    assert list(iter_json_array([b'[1,', b' "a"]'])) == [1, "a"]
+    assert list(iter_json_array([' [', ' ] \n'])) == []
+
+
+@pytest.mark.parametrize('document', [
+    '[1 2]',
+    '[1,,2]',
+    '[,1]',
+    '[1,]',
+    '[1] 2',
+    '[1]]',
+    '{"launches": []}',
+    '',
+])
+def test_rejects_malformed_arrays(document):
+    for chunks in splits(document):
+        with pytest.raises(ValueError):
+            list(iter_json_array(chunks))
+
+
+@pytest.mark.parametrize('document', ['[1, 2', '[1, 2,', '[{"core": 1}', '["unterminated'])
+def test_end_of_stream_before_closing_bracket(document):
+    for chunks in splits(document):
+        with pytest.raises(ValueError):
+            list(iter_json_array(chunks))
@@ -0,0 +1,71 @@
+# ----------------------------------------------------------
+# SpaceX Rocket Launch Data Project - Crawler tests
+# Purpose: Crawl the local fixture server instead of Wikipedia and check caching and merging
+# Key Concepts: pytest fixtures, conditional GET (304), merge by (vehicle, flight number)
+# Author: Harry.Zhang
+# ----------------------------------------------------------
+
+import os
+
+import pandas as pd
+import pytest
+
+from spacex_crawler import crawl
+from spacex_fixture_server import build_launch_page, start_fixture_server
+
+F9_LIST = "List_of_Falcon_9_and_Falcon_Heavy_launches"
+
+
+@pytest.fixture
+def fixture_server():
+    servers = []
+
+    def start(pages):
+        server, base_url = start_fixture_server(pages)
+        servers.append(server)
+        return server.RequestHandlerClass, base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def test_second_crawl_revalidates_cache(fixture_server, tmp_path):
+    targets = [(F9_LIST, "1"), (F9_LIST, "2")]
+    handler, base_url = fixture_server({targets[0]: build_launch_page(range(1, 6)),
+                                        targets[1]: build_launch_page(range(4, 9))})
+
+    first = crawl(targets, base_url, processes=1, cache_dir=str(tmp_path))
+    assert handler.not_modified_count == 0
+    second = crawl(targets, base_url, processes=1, cache_dir=str(tmp_path))
+
+    assert handler.request_count == 4
+    assert handler.not_modified_count == 2
+    pd.testing.assert_frame_equal(first, second)
+    assert list(first['Flight No.']) == [str(n) for n in range(1, 9)]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+
+def test_same_flight_number_kept_per_vehicle(fixture_server):
+    targets = [(F9_LIST, None), ("Falcon_Heavy", None)]
+    _, base_url = fixture_server({targets[0]: build_launch_page(range(1, 4)),
+                                  targets[1]: build_launch_page(range(1, 3))})
+
+    df = crawl(targets, base_url, processes=1)
+
+    assert len(df) == 5
+    assert sorted(zip(df['Vehicle'], df['Flight No.'])) == [
+        ("Falcon 9", "1"), ("Falcon 9", "2"), ("Falcon 9", "3"), ("Falcon Heavy", "1"), ("Falcon Heavy", "2")]
+
+
+def test_later_target_wins(fixture_server):
+    targets = [(F9_LIST, "1"), (F9_LIST, "2")]
+    updated = build_launch_page(range(2, 4)).replace("Payload 3<", "Payload 3 (updated)<")
+    _, base_url = fixture_server({targets[0]: build_launch_page(range(1, 4)), targets[1]: updated})
+
+    df = crawl(targets, base_url, processes=1).set_index('Flight No.')
+
+    assert df.loc["3", 'Payload'] == "Payload 3 (updated)"
+    assert df.loc["1", 'Payload'] == "Payload 1"
+    assert len(df) == 3